@@ -11,6 +11,7 @@ import os
 import re
 import sys
 import json
+from functools import lru_cache
 from collections import namedtuple
 
 try:
@@ -85,6 +86,9 @@ _THROWAWAY_SET = {
     'copyright',
 }
 
+# All regexes in this module are run on text that _cleanup has already
+# converted to lowercase, so they are compiled without re.IGNORECASE.
+
 # a word, possibly hyphenated or abbreviated
 _str_word = r'[-a-z]+\.?\s?'
 
@@ -100,7 +104,7 @@ _str_int = r'(?<!covid)(?<!covid-)(?<!\d)(\d{1,3}(,\d{3})+|(?<![,\d])\d+(k|m|\s?
 # find numbers such as 3.4 million, 4 thousand, etc.
 _str_float_word = r'(?<!\d)(?P<floatnum>\d+(\.\d+)?)\s' +\
     r'(?P<floatunits>(thousand|million))'
-_regex_float_word = re.compile(_str_float_word, re.IGNORECASE)
+_regex_float_word = re.compile(_str_float_word)
 
 # Create a regex that recognizes either an int with commas, a decimal integer,
 # a textual integer, or an enumerated integer. The enum must be followed either
@@ -136,7 +140,7 @@ _str_num = r'(' + r'(\bfrom\s)?' +\
 _str_duration = r'(' + _str_num + r'|' + r'\ba\b' + r')' +\
     r'[-\s](years?|yrs?\.?|months?|mo\.?|weeks?|wk\.?|' +\
     r'days?|hours?|hrs?\.?|minutes?|min\.?|seconds?|sec\.?)(?![a-z])(\sago\s)?'
-_regex_duration = re.compile(_str_duration, re.IGNORECASE)
+_regex_duration = re.compile(_str_duration)
 
 # clock times
 
@@ -146,7 +150,21 @@ _str_am_pm = r'[ap]\.?m\.?'
 _str_tz = r'(ak|ha|e|c|m|p|h)[sd]t\b'
 _str_clock = r'(?<!\d)(2[0-3]|1[0-9]|0[0-9])[-:\s][0-5][0-9]\s?' +\
     _str_am_pm + r'\s?' + _str_tz
-_regex_clock = re.compile(_str_clock, re.IGNORECASE)
+_regex_clock = re.compile(_str_clock)
+
+# month-day constructs such as 6-24
+_str_month_day = r'(?<!\d)(0?[0-9]|1[0-2])[-/]([0-2][0-9]|3[01])'
+_regex_month_day = re.compile(_str_month_day)
+
+# regexes used for sentence cleanup
+_regex_all_digits   = re.compile(r'\A\d+\Z')
+_regex_virus_joined = re.compile(r'[a-z\d](covid|coronavirus)')
+_regex_w_slash      = re.compile(r'\sw/\s')
+_regex_apostrophe   = re.compile(r'[\']')
+_regex_punct        = re.compile(r'[&(){}\[\]:~/@;]')
+_regex_text_comma   = re.compile(r'\D,\D')
+_regex_whitespace   = re.compile(r'\s+')
+_regex_test         = re.compile(r'test(ed)?')
 
 
 _str_coronavirus = r'(covid([-\s]?19)?|(novel\s)?(corona)?virus|disease)([-\s]related)?\s?'
@@ -162,7 +180,7 @@ _str_who = r'\b(babies|baby|boy|captive|child|children|citizen|client|'      +\
     r'national|neighbor|newborn|occupant|passenger|patient|patron|people|'   +\
     r'personnel|prisoner|regular|resident|shopper|staff|tourist|traveler|'   +\
     r'victim|visitor|voter|woman|women|worker)s?\s?'
-_regex_who = re.compile(_str_who, re.IGNORECASE)
+_regex_who = re.compile(_str_who)
 
 #
 # death regexes
@@ -171,37 +189,37 @@ _regex_who = re.compile(_str_who, re.IGNORECASE)
 # <num> <words> <coronavirus> deaths
 _str_death0 = _str_num + r'\s?' + _str_words + _str_coronavirus +\
     r'(deaths|(?<!a\s)death)'
-_regex_death0 = re.compile(_str_death0, re.IGNORECASE)
+_regex_death0 = re.compile(_str_death0)
 
 # <num> <words> deaths <words> <coronavirus>
 _str_death1 = _str_num + r'\s?' + _str_words + r'(deaths|(?<!a\s)death)\s?' +\
     _str_words + _str_coronavirus
-_regex_death1 = re.compile(_str_death1, re.IGNORECASE)
+_regex_death1 = re.compile(_str_death1)
 
 # <num> <words> (deaths?|died)
 # don't capture "candied", "deaths of", "died of" with this regex
 # if regex index is changed from 2, fix special handling below in _regex_match
 _str_death2 = _str_num + r'\s?' + r'(?P<words>' + _str_words + r')' +\
     r'((deaths|(?<!a\s)death)|(?<![a-z])(died|dead(?![a-z])))(?! of)'
-_regex_death2 = re.compile(_str_death2, re.IGNORECASE)
+_regex_death2 = re.compile(_str_death2)
 
 # <coronavirus> <words> deaths <words> <num>
 # prevent a match at the start of a space-separated list of numbers
 _str_death3 = _str_coronavirus + _str_words + r'(deaths|(?<!a\s)death)\s?' +\
     _str_words + _str_num + r'(?! \d)'
-_regex_death3 = re.compile(_str_death3, re.IGNORECASE)
+_regex_death3 = re.compile(_str_death3)
 
 # <num> <who> (have)? died <words> <coronavirus>
 _str_death4 = _str_num + r'\s?' + _str_words + r'\s?'      +\
     r'(' + _str_who + r')?' + r'(have\s)?(?<![a-z])died\s' +\
     _str_words + _str_coronavirus
-_regex_death4 = re.compile(_str_death4, re.IGNORECASE)
+_regex_death4 = re.compile(_str_death4)
 
 # deaths|died <connector> <words> <num>
 # also prevent a match at the start of a space-separated list of numbers
 _str_death5 = r'\b((deaths|(?<!a\s)death)|died)[-\s:]{1,2}' + _str_words +\
     _str_num + r'(?! (of|\d))'
-_regex_death5 = re.compile(_str_death5, re.IGNORECASE)
+_regex_death5 = re.compile(_str_death5)
 
 #
 # case count regexes
@@ -210,53 +228,53 @@ _regex_death5 = re.compile(_str_death5, re.IGNORECASE)
 # <num> <words> positive for <words> <coronavirus>
 _str_case0 = _str_num + r'\s' + r'(?P<words>' + _str_words + r')' +\
     r'(?<!\bnot tested )positive\sfor\s' + _str_words + _str_coronavirus
-_regex_case0 = re.compile(_str_case0, re.IGNORECASE)
+_regex_case0 = re.compile(_str_case0)
 
 # <num> <words> tested positive
 _str_case1 = _str_num + r'\s' + r'(?P<words>' + _str_words + r')' +\
     r'(?<!\bnot )tested\spositive'
-_regex_case1 = re.compile(_str_case1, re.IGNORECASE)
+_regex_case1 = re.compile(_str_case1)
 
 # <num> <words> <coronavirus> cases?
 _str_case2 = _str_num + r'\s' + _str_words + _str_coronavirus + r'cases?'
-_regex_case2 = re.compile(_str_case2, re.IGNORECASE)
+_regex_case2 = re.compile(_str_case2)
 
 # <num> <words> cases? <words> <coronavirus>
 _str_case3 = _str_num + r'\s' + _str_words + r'cases?\s' + _str_words + _str_coronavirus
-_regex_case3 = re.compile(_str_case3, re.IGNORECASE)
+_regex_case3 = re.compile(_str_case3)
 
 # <num> <words> with <coronavirus>
 #_str_case4 = _str_num + r'\s' + _str_words + r'with\s' + _str_coronavirus
 _str_case4 = _str_num + r'\s' + _str_who + r'with\s' + _str_coronavirus
-_regex_case4 = re.compile(_str_case4, re.IGNORECASE)
+_regex_case4 = re.compile(_str_case4)
 
 # (total|number of) <words> <coronavirus> cases? <words> <num>
 _str_case5 = r'(total|number\sof)\s' + _str_words + _str_coronavirus + r'cases?\s' + _str_words + _str_num
-_regex_case5 = re.compile(_str_case5, re.IGNORECASE)
+_regex_case5 = re.compile(_str_case5)
 
 # (total|number of) <words> cases? <words> <num>
 _str_case6 = r'(total|number\sof)\s' + _str_words + r'cases?\s' + _str_words + _str_num
-_regex_case6 = re.compile(_str_case6, re.IGNORECASE)
+_regex_case6 = re.compile(_str_case6)
 
 # <coronavirus> cases? <words> <num>
 _str_case7 = _str_coronavirus + r'cases?\s' + r'(?P<words>' + _str_one_or_more_words + r')' + _str_num
-_regex_case7 = re.compile(_str_case7, re.IGNORECASE)
+_regex_case7 = re.compile(_str_case7)
 
 # cases (at|to(\sover)?)\s <num>
 _str_case8 = r'(cases|total)\s(at|to(\sover))\s' + _str_num
-_regex_case8 = re.compile(_str_case8, re.IGNORECASE)
+_regex_case8 = re.compile(_str_case8)
 
 # <num> <words> cases?
 _str_case9 = _str_num + r'\s?' + _str_words + r'cases?'
-_regex_case9 = re.compile(_str_case9, re.IGNORECASE)
+_regex_case9 = re.compile(_str_case9)
 
 # confirmed <words> <coronavirus> <words> <num>
 _str_case10 = r'\bconfirmed\s' + _str_words + _str_coronavirus + _str_words + _str_num
-_regex_case10 = re.compile(_str_case10, re.IGNORECASE)
+_regex_case10 = re.compile(_str_case10)
 
 # cases? <words> for a total of <num>
 _str_case11 = r'\bcases?\s' + _str_words  + r'\s?for a total of ' + _str_num
-_regex_case11 = re.compile(_str_case11, re.IGNORECASE)
+_regex_case11 = re.compile(_str_case11)
 
 _CASE_REGEXES = [
     _regex_case0,
@@ -282,6 +300,37 @@ _DEATH_REGEXES = [
     _regex_death5,
 ]
 
+# Literal strings required by each regex; at least one must be present in the
+# (lowercase) cleaned sentence for the regex to have any chance of matching.
+_REGEX_ANCHORS = {
+    _regex_case0  : ('positive',),
+    _regex_case1  : ('tested',),
+    _regex_case2  : ('case',),
+    _regex_case3  : ('case',),
+    _regex_case4  : ('with',),
+    _regex_case5  : ('case',),
+    _regex_case6  : ('case',),
+    _regex_case7  : ('case',),
+    _regex_case8  : ('cases', 'total'),
+    _regex_case9  : ('case',),
+    _regex_case10 : ('confirmed',),
+    _regex_case11 : ('case',),
+    _regex_death0 : ('death',),
+    _regex_death1 : ('death',),
+    _regex_death2 : ('death', 'died', 'dead'),
+    _regex_death3 : ('death',),
+    _regex_death4 : ('died',),
+    _regex_death5 : ('death', 'died'),
+}
+
+# Every case and death regex has anchors, so a sentence containing none of
+# them cannot produce a result. Cleanup only lowercases, removes apostrophes,
+# rewrites ' w/ ' as ' with ', and replaces other text with whitespace, so the
+# anchors (plus 'w/') can be checked before the cleanup and date finder run.
+_RUN_ANCHORS = tuple(sorted(
+    {a for anchors in _REGEX_ANCHORS.values() for a in anchors} | {'w/'}
+))
+
 # matching data used to build the result object
 MatchTuple = namedtuple('MatchTuple', ['start', 'end', 'text', 'value'])
 
@@ -301,14 +350,8 @@ def _erase(sentence, candidates):
     cleaned sentence and offsets need to be preserved.
     """
 
-    new_sentence = sentence
-    for c in candidates:
-        start = c.start
-        end = c.end
-        s1 = new_sentence[:start]
-        s2 = ' '*(end-start)
-        s3 = new_sentence[end:]
-        new_sentence = s1 + s2 + s3
+    new_sentence = _erase_segments(sentence,
+                                   [(c.start, c.end) for c in candidates])
 
     if _TRACE:
         print('sentence after erasing candidates: ')
@@ -319,15 +362,20 @@ def _erase(sentence, candidates):
     
 
 ###############################################################################
-def _erase_segment(sentence, start, end):
+def _erase_segments(sentence, segments):
     """
-    Replace sentence[start:end] with whitespace.
+    Replace sentence[start:end] with whitespace for each (start, end) pair
+    in segments. The new sentence is built in a single pass rather than by
+    concatenating strings for each segment.
     """
+
+    if 0 == len(segments):
+        return sentence
     
-    s1 = sentence[:start]
-    s2 = ' '*(end - start)
-    s3 = sentence[end:]
-    return s1 + s2 + s3
+    chars = list(sentence)
+    for start, end in segments:
+        chars[start:end] = ' '*(end - start)
+    return ''.join(chars)
     
 
 ###############################################################################
@@ -347,12 +395,11 @@ def _erase_time_expressions(sentence):
     for match in iterator:
         segments.append ( (match.start(), match.end()) )
 
-    for start,end in segments:
-        if _TRACE:
-            print('\terasing time expression "{0}"'.format(sentence[start:end]))    
-        sentence = _erase_segment(sentence, start, end)
+    if _TRACE:
+        for start,end in segments:
+            print('\terasing time expression "{0}"'.format(sentence[start:end]))
 
-    return sentence
+    return _erase_segments(sentence, segments)
 
 
 ###############################################################################
@@ -368,6 +415,7 @@ def _erase_dates(sentence):
     dates = [DateValue(**record) for record in json_data]
 
     # erase each date expression from the sentence
+    segments = []
     for date in dates:
         start = int(date.start)
         end   = int(date.end)
@@ -376,26 +424,23 @@ def _erase_dates(sentence):
             print('\tfound date expression: "{0}"'.format(date))
 
         # erase date if not all digits
-        if not re.match(r'\A\d+\Z', date.text):
+        if not _regex_all_digits.match(date.text):
             if _TRACE:
                 print('\terasing date "{0}"'.format(date.text))
-            sentence = _erase_segment(sentence, start, end)
+            segments.append( (start, end) )
+    sentence = _erase_segments(sentence, segments)
 
     # look for constructs such as 6-24 and similar
-    _str_month_day = r'(?<!\d)(0?[0-9]|1[0-2])[-/]([0-2][0-9]|3[01])'
-    _regex_month_day = re.compile(_str_month_day)
-
     segments = []
     iterator = _regex_month_day.finditer(sentence)
     for match in iterator:
         segments.append( (match.start(), match.end()))
-    for start,end in segments:
-        if _TRACE:
+    if _TRACE:
+        for start,end in segments:
             print('\terasing month-day expression "{0}"'.
                   format(sentence[start:end]))
-        sentence = _erase_segment(sentence, start, end)
             
-    return sentence
+    return _erase_segments(sentence, segments)
 
 
 ###############################################################################
@@ -427,8 +472,7 @@ def _cleanup(sentence):
 
     # insert a missing space prior to a virus-related word
     space_pos = []
-    iterator = re.finditer(r'[a-z\d](covid|coronavirus)',
-                           sentence, re.IGNORECASE)
+    iterator = _regex_virus_joined.finditer(sentence)
     for match in iterator:
         # position where the space is needed
         pos = match.start() + 1
@@ -437,17 +481,17 @@ def _cleanup(sentence):
     sentence = ' '.join(chunks)
     
     # replace ' w/ ' with ' with '
-    sentence = re.sub(r'\sw/\s', ' with ', sentence)
+    sentence = _regex_w_slash.sub(' with ', sentence)
 
     # erase certain characters
-    sentence = re.sub(r'[\']', '', sentence)
+    sentence = _regex_apostrophe.sub('', sentence)
     
     # replace selected chars with whitespace
-    sentence = re.sub(r'[&(){}\[\]:~/@;]', ' ', sentence)
+    sentence = _regex_punct.sub(' ', sentence)
     
     # replace commas with whitespace if not inside a number (such as 32,768)
     comma_pos = []
-    iterator = re.finditer(r'\D,\D', sentence, re.IGNORECASE)
+    iterator = _regex_text_comma.finditer(sentence)
     for match in iterator:
         pos = match.start() + 1
         comma_pos.append(pos)
@@ -462,7 +506,7 @@ def _cleanup(sentence):
     sentence = _erase_time_expressions(sentence)
     
     # collapse repeated whitespace
-    sentence = re.sub(r'\s+', ' ', sentence)
+    sentence = _regex_whitespace.sub(' ', sentence)
 
     if _TRACE:
         print('sentence after cleanup: "{0}"'.format(sentence))
@@ -478,7 +522,7 @@ def _to_int(str_int):
     if -1 == _str_int.find(','):
         val = int(str_int)
     else:
-        text = re.sub(r',', '', str_int)
+        text = str_int.replace(',', '')
         multiplier = 1
         if text.endswith(' dozen'):
             # note the space preceding 'dozen'
@@ -572,6 +616,11 @@ def _regex_match(sentence, regex_list):
     
     candidates = []
     for i, regex in enumerate(regex_list):
+        # skip the regex if none of its required literals are present
+        anchors = _REGEX_ANCHORS.get(regex)
+        if anchors is not None and not any(a in sentence for a in anchors):
+            continue
+        
         # finditer finds non-overlapping matches
         iterator = regex.finditer(sentence)
         for match in iterator:
@@ -585,7 +634,7 @@ def _regex_match(sentence, regex_list):
             if _regex_case0 == regex or _regex_case1 == regex:
                 words = match.group('words').strip()
                 # remove 'tested' or 'test'
-                words = re.sub(r'test(ed)?', ' ', words)
+                words = _regex_test.sub(' ', words)
                 match2 = _regex_who.search(words)
                 if not match2 and not words.isspace():
                     # skip this, does not refer to groups of people
@@ -745,10 +794,21 @@ def _extract_candidates(candidates):
             
             
 ###############################################################################
+@lru_cache(maxsize=8192)
 def run(sentence):
     """
+    Find case, hospitalization, and death counts in the sentence. Returns a
+    JSON array containing info on all values extracted.
+
+    The JSON result is immutable, so results for repeated sentences are
+    served from an LRU cache. Call run.cache_clear() to empty it.
     """
 
+    # skip the cleanup and regex matching if no regex can possibly match
+    sentence_lc = sentence.lower().replace("'", '')
+    if not any(a in sentence_lc for a in _RUN_ANCHORS):
+        return json.dumps([], indent=4)
+
     cleaned_sentence = _cleanup(sentence)
 
     # find case report counts and erase matches from sentence
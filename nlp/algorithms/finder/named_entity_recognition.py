@@ -32,8 +32,11 @@ descriptions = {
 
 
 def nlp_init(tries=0):
-    if tries > 0:
-        log('Retrying, try%d' % tries)
+    """
+    Load the spaCy model, or wait for another thread that is loading it.
+    The 'tries' argument is the number of the 30 10s waits already used up,
+    which shortens the wait budget accordingly.
+    """
 
     global loading_status
     if loading_status == 'none' and 'nlp' not in data:
@@ -46,10 +49,15 @@ def nlp_init(tries=0):
             log(exc)
             loading_status = 'none'
     elif loading_status == 'loading' and tries < 30:
-        time.sleep(10)
-        if loading_status == 'loading':
-            new_tries = tries + 1
-            return nlp_init(tries=new_tries)
+        # another thread is loading the model; poll often at first so this
+        # thread resumes soon after the model is ready, backing off to 10s
+        # between checks, within what is left of the 30 10s waits
+        delay = 0.1
+        remaining = (30 - tries) * 10.0
+        while loading_status == 'loading' and remaining > 0:
+            time.sleep(delay)
+            remaining -= delay
+            delay = min(2.0 * delay, 10.0)
 
     return data['nlp']
 
@@ -119,6 +119,7 @@ import re
 import sys
 import json
 import argparse
+from functools import lru_cache
 from collections import namedtuple
 
 if __name__ == '__main__':
@@ -182,7 +183,30 @@ _VERSION_MINOR = 8
 _TRACE = False
 
 # connectors between portions of the regexes below; either symbols or words
-_str_cond = r'(?P<cond>(~=|>=|<=|[-/:<>=~\s.@^]+|\s[a-z\s]+)+)?'
+#
+# A connector is a run of symbols. If that run ends in whitespace it can be
+# followed by words, which can in turn be followed by another symbol run, and
+# so on. The connector used to be written as
+#
+#     (~=|>=|<=|[-/:<>=~\s.@^]+|\s[a-z\s]+)+
+#
+# but that form can divide runs of whitespace and words among the loop
+# iterations in exponentially many ways, which causes catastrophic
+# backtracking on long multi-line text. The nested form built below tries the
+# possible ends of the connector in the same order, but reaches each end in
+# only one way. The re module does not support recursive patterns, so the
+# nesting is unrolled to a fixed depth of symbol/word alternations. Past that
+# depth the innermost symbol run continues with a flat loop of words and
+# symbols, which matches the same text as the old form but may try the ends of
+# such long connectors in a different order.
+_CONNECTOR_DEPTH = 8
+_str_cond_sym     = r'[-/:<>=~\s.@^]'
+_str_cond_nonspace = r'[-/:<>=~.@^]'
+_str_cond = _str_cond_sym + r'+(?:(?<=\s)[a-z]+' + _str_cond_sym + r'*)*?'
+for _ in range(_CONNECTOR_DEPTH):
+    _str_cond = _str_cond_sym + r'+(?:(?<=\s)[a-z][a-z\s]*'          +\
+        r'(?:(?=' + _str_cond_nonspace + r')' + _str_cond + r')?)??'
+_str_cond = r'(?P<cond>' + _str_cond + r')?'
 
 # words, possibly hyphenated or abbreviated, nongreedy match
 _str_words = r'([-a-z\s./:~]+?)?'
@@ -525,6 +549,32 @@ _str_pf_ratio = r'\b(pao2|p)\s?/\s?(fio2|f)(\s?ratio)?' +\
     r'(' + _str_cond + r')?' + r'(?P<val>\d+(\.\d+)?)'
 _regex_pf_ratio = re.compile(_str_pf_ratio, re.IGNORECASE)
 
+# Literal strings required by each regex; at least one must be present in the
+# casefolded sentence for the regex to have any chance of matching. Regexes
+# without an entry (such as the device-only regexes) are always run.
+_STR_SAT_ANCHORS  = ('o2', 'ox', 'sat')
+_STR_NEED_ANCHORS = ('need', 'requir', 'increas', 'receiv', 'placed',
+                     'continu', 'on home')
+_STR_FIO2_ANCHORS = ('fio2', 'fi02', 'o2 flow')
+_REGEX_ANCHORS = {
+    _regex0               : _STR_SAT_ANCHORS,
+    _regex1               : _STR_SAT_ANCHORS,
+    _regex2               : _STR_SAT_ANCHORS,
+    _regex3               : _STR_SAT_ANCHORS,
+    _regex5               : _STR_SAT_ANCHORS,
+    _regex6               : _STR_SAT_ANCHORS,
+    _regex7               : _STR_SAT_ANCHORS,
+    _regex8               : _STR_SAT_ANCHORS,
+    _regex_need_o2        : _STR_NEED_ANCHORS,
+    _regex_need_o2_device : _STR_NEED_ANCHORS,
+    _regex_need_o2_flow   : _STR_NEED_ANCHORS,
+    _regex_pao2           : ('pao2', 'partial pressure'),
+    _regex_fio2_1         : _STR_FIO2_ANCHORS,
+    _regex_fio2_2         : _STR_FIO2_ANCHORS,
+    _regex_fio2_3         : _STR_FIO2_ANCHORS,
+    _regex_pf_ratio       : ('/',),
+}
+
 # convert SpO2 to PaO2
 # https://www.intensive.org/epic2/Documents/Estimation%20of%20PO2%20and%20FiO2.pdf
 _SPO2_TO_PAO2 = {
@@ -560,6 +610,17 @@ _MIN_SPO2_PCT = 50
 # Sometimes the 'cond' group captures too much.
 _COND_DISCARD_SET = {'sat', 'saturation', 'o2', 'oxygen'}
 
+# regexes used for sentence cleanup and match filtering
+_regex_w_slash    = re.compile(r'\sw/\s')
+_regex_comma_amp  = re.compile(r'[,&]')
+_regex_zero_two   = re.compile(r'\b02\b')
+_regex_whitespace = re.compile(r'\s+')
+_regex_device_pct = re.compile(r'(?P<pct>\d+)\s?%')
+
+# a period followed by a capitalized word, which indicates a missed
+# sentence boundary inside a match
+_regex_new_sentence = re.compile(r'\.\s[A-Z][a-z]+')
+
 
 ###############################################################################
 def enable_debug():
@@ -582,16 +643,16 @@ def _cleanup(sentence):
     """
 
     # replace ' w/ ' with ' with '
-    sentence = re.sub(r'\sw/\s', ' with ', sentence)
+    sentence = _regex_w_slash.sub(' with ', sentence)
     
     # replace selected chars with whitespace
-    sentence = re.sub(r'[,&]', ' ', sentence)
+    sentence = _regex_comma_amp.sub(' ', sentence)
 
     # replace "02" (zero char) with O2
-    sentence = re.sub(r'\b02\b', 'o2', sentence)
+    sentence = _regex_zero_two.sub('o2', sentence)
 
     # collapse repeated whitespace
-    sentence = re.sub(r'\s+', ' ', sentence)
+    sentence = _regex_whitespace.sub(' ', sentence)
 
     return sentence
 
@@ -650,7 +711,7 @@ def _estimate_fio2(flow_rate, device):
 
     # can get FiO2 from stated percentage of nonrebreather mask
     if device_type in _DEVICES_WITH_FIO2_PCT:
-        match = re.search(r'(?P<pct>\d+)\s?%', device_str)
+        match = _regex_device_pct.search(device_str)
         if match:
             fio2_est = float(match.group('pct'))
     
@@ -659,13 +720,10 @@ def _estimate_fio2(flow_rate, device):
             if _TRACE: print('\t  no flow rate available, exiting...')
             return device_str, EMPTY_FIELD
         else:
-            for dt in _DEVICE_MAP:
-                if dt == device_type:
-                    # lookup a conversion function
-                    conversion_fn = _DEVICE_MAP[dt]
-                    if conversion_fn is not None:
-                        fio2_est = conversion_fn(flow_rate)
-                        break
+            # lookup a conversion function
+            conversion_fn = _DEVICE_MAP[device_type]
+            if conversion_fn is not None:
+                fio2_est = conversion_fn(flow_rate)
 
     return device_str, fio2_est
     
@@ -686,15 +744,14 @@ def _estimate_pao2(spo2):
     elif spo2 <= 80:
         p = 44
     else:
-        for s0 in range(80, 99):
-            # find known bounds on the SpO2 value, then linearly interpolate
-            if spo2 >= s0 and spo2 < (s0 + 1.0):
-                p0 = _SPO2_TO_PAO2[s0]
-                p1 = _SPO2_TO_PAO2[s0+1]
-                # slope m = delta_p/delta_s
-                m = (p1 - p0) # denom == (s0+1 - s0) == 1
-                p = p0 + m * (spo2 - s0)
-                break
+        # the table has an entry for every integer SpO2 value, so the lower
+        # bound is the integer part of spo2; linearly interpolate from there
+        s0 = int(spo2)
+        p0 = _SPO2_TO_PAO2[s0]
+        p1 = _SPO2_TO_PAO2[s0+1]
+        # slope m = delta_p/delta_s
+        m = (p1 - p0) # denom == (s0+1 - s0) == 1
+        p = p0 + m * (spo2 - s0)
 
     assert p is not None
     return p
@@ -725,9 +782,16 @@ def _regex_match(sentence, regex_list):
     """
 
     num_regexes = len(regex_list)
+
+    # used to skip any regex whose required literal text is absent
+    sentence_cf = sentence.casefold()
     
     candidates = []
     for i, regex in enumerate(regex_list):
+        anchors = _REGEX_ANCHORS.get(regex)
+        if anchors is not None and not any(a in sentence_cf for a in anchors):
+            continue
+        
         iterator = regex.finditer(sentence)
         for match in iterator:
             match_text = match.group().strip()
@@ -738,7 +802,7 @@ def _regex_match(sentence, regex_list):
             #
             # In other words, the sentence segmentation should have started
             # a new sentence at "Pt", in which case the match would be correct.
-            special_match = re.search(r'\.\s[A-Z][a-z]+', match_text)
+            special_match = _regex_new_sentence.search(match_text)
             if special_match:
                 continue
 
@@ -746,18 +810,18 @@ def _regex_match(sentence, regex_list):
             # the condition captures sat, saturation, etc.
             
             discard_match = False
-            for k,v in match.groupdict().items():
-                if 'cond' == k:
-                    if v is not None:
-                        text = v.lower()
-                        for word in _COND_DISCARD_SET:
-                            if word in text:
-                                if _TRACE:
-                                    print('\tDiscarding match; discard ' \
-                                          'word "{0}" appears in "cond" '  \
-                                          'group "{1}"'.format(word, text))
-                                discard_match = True
-                                break
+            if 'cond' in regex.groupindex:
+                v = match.group('cond')
+                if v is not None:
+                    text = v.lower()
+                    for word in _COND_DISCARD_SET:
+                        if word in text:
+                            if _TRACE:
+                                print('\tDiscarding match; discard ' \
+                                      'word "{0}" appears in "cond" '  \
+                                      'group "{1}"'.format(word, text))
+                            discard_match = True
+                            break
             if discard_match:
                 continue
             
@@ -808,7 +872,8 @@ def _regex_match(sentence, regex_list):
             # the regex match object is stored in the 'other' field
             matchobj = c.other
             matchobj_prev = candidates[i-1].other
-            if 'device' in matchobj.groupdict() and 'device' in matchobj_prev.groupdict():
+            if 'device' in matchobj.re.groupindex and \
+               'device' in matchobj_prev.re.groupindex:
                 device = matchobj.group('device')
                 device_prev = matchobj_prev.group('device')
                 if device is not None and device_prev is not None:
@@ -959,17 +1024,21 @@ def _erase(sentence, candidates):
         new_sentence = s1 + s2 + s3
 
     # collapse repeated whitespace, if any
-    new_sentence = re.sub(r'\s+', ' ', new_sentence)
+    new_sentence = _regex_whitespace.sub(' ', new_sentence)
         
     return new_sentence
 
 
 ###############################################################################
+@lru_cache(maxsize=8192)
 def run(sentence):
     """
     Find values related to oxygen saturation, flow rates, etc. Compute values
     such as P/F ratio when possible. Returns a JSON array containing info
     on all values extracted or computed.
+
+    The JSON result is immutable, so results for repeated sentences are
+    served from an LRU cache. Call run.cache_clear() to empty it.
     """
 
     results = []
@@ -1024,6 +1093,10 @@ def run(sentence):
     if _TRACE:
         print('Extracting data from pruned candidates...')
 
+    # device-only matches on the full sentence, computed on first use and
+    # shared by all candidates that have no device of their own
+    device_candidates = None
+
     for pc in sao2_candidates:
         # recover the regex match object from the 'other' field
         match = pc.other
@@ -1089,7 +1162,9 @@ def run(sentence):
 
         # if no device found, check device regex independently
         if EMPTY_FIELD == device:
-            device_candidates = _regex_match(cleaned_sentence, [_regex_device])
+            if device_candidates is None:
+                device_candidates = _regex_match(cleaned_sentence,
+                                                 [_regex_device])
             if len(device_candidates) > 0:
                 # take the first match
                 for k,v in device_candidates[0].other.groupdict().items():
@@ -104,7 +104,7 @@ import os
 import sys
 import json
 import regex as re
-from copy import deepcopy
+from functools import lru_cache
 from enum import Enum, unique
 from collections import namedtuple
 from claritynlp_logging import log, ERROR, DEBUG
@@ -216,6 +216,10 @@ _str_approx = r'((approximately|about|up to|at least|at most|' +\
 
 _regex_number = re.compile(r'\A' + _x + r'\Z')
 
+# every measurement contains at least one digit
+_regex_digit = re.compile(r'\d')
+_regex_whitespace = re.compile(r'\s')
+
 # Lists must be preceded by whitespace, to avoid capturing the digit
 # in 'fio2' and similar abbreviations. Also, lists ALWAYS have an 'and'
 # before the final item, and must contain at least two items.
@@ -250,6 +254,13 @@ _str_previous = r'(' +\
 
 _regex_previous = re.compile(_str_previous);
 
+# Every 'previous' expression above contains at least one of these literal
+# strings. Sentences without any of them cannot match _regex_previous.
+_str_previous_cue = r'(prev|prior|earlier|compar|was|versus|vs|then|from|'   +\
+    r'enlarged|changed|decreased|observed|identified|seen|appreciated|'     +\
+    r'noted|confirmed|demonstrated|demon_strated|present)'
+_regex_previous_cue = re.compile(_str_previous_cue)
+
 # match (), {}, and []
 _str_brackets = r'[(){}\[\]]'
 _regex_brackets = re.compile(_str_brackets)
@@ -301,9 +312,15 @@ _CM_TO_MM_SQ = _CM_TO_MM * _CM_TO_MM
 _IN_TO_MM    = 25.4
 _IN_TO_MM_SQ = _IN_TO_MM * _IN_TO_MM
 
-_CHAR_SPACE = ' '
+# The units strings matched by _strUnits are distinguished by their first
+# char: 'c' for cm, centimeters, and cc, 'i' for inches, and 'm' for mm.
+# Map the first char to the (linear, area, volume) conversion factors to mm.
+_UNIT_CONVERSION_MAP = {
+    'c' : (_CM_TO_MM, _CM_TO_MM, _CM_TO_MM_SQ),
+    'i' : (_IN_TO_MM, _IN_TO_MM, _IN_TO_MM_SQ),
+}
 
-_LIST_TOKENIZER_FUNCTION_NAME = '_tokenize_list'
+_CHAR_SPACE = ' '
 
 # namedtuple objects found by this code - internal use only
 _MEAS_FIELDS = [
@@ -416,17 +433,11 @@ def _to_json(measurement_list):
 
         # compute minValue and maxValue
         if is_list:
-            minValue = min(m_dict['values'])
-            maxValue = max(m_dict['values'])
+            data = m_dict['values']
         else:
             # compute min and max values of [x, y, z]
-            data = []
-            if EMPTY_FIELD != m_dict['x']:
-                data.append(m_dict['x'])
-            if EMPTY_FIELD != m_dict['y']:
-                data.append(m_dict['y'])
-            if EMPTY_FIELD != m_dict['z']:
-                data.append(m_dict['z'])
+            data = [v for v in (m_dict['x'], m_dict['y'], m_dict['z'])
+                    if EMPTY_FIELD != v]
 
             # something wrong if empty dict
             if 0 == len(data):
@@ -434,11 +445,8 @@ def _to_json(measurement_list):
                 log(m_dict)
                 assert len(data) > 0
 
-            minValue = min(data)
-            maxValue = max(data)
-            
-        m_dict['minValue'] = minValue
-        m_dict['maxValue'] = maxValue
+        m_dict['minValue'] = min(data)
+        m_dict['maxValue'] = max(data)
         
         # this measurement has now been converted
         dict_list.append(m_dict)
@@ -486,15 +494,17 @@ def _num_to_float(num_str):
     """
 
     # replace any embedded spaces with the empty string
-    str_no_spaces = re.sub(r'\s', '', num_str)
+    str_no_spaces = _regex_whitespace.sub('', num_str)
     return float(str_no_spaces)
 
 
 ###############################################################################
+@lru_cache(maxsize=256)
 def _is_area_unit(units_text):
     """
     Determine whether the given units text represents a unit of area and
-    return a Boolean result.
+    return a Boolean result. The set of units strings is small, so the
+    results are cached.
     """
 
     match = _regex_is_area_unit.search(units_text)
@@ -505,10 +515,12 @@ def _is_area_unit(units_text):
 
 
 ###############################################################################
+@lru_cache(maxsize=256)
 def _is_vol_unit(units_text):
     """
     Determine whether the given units text represents a unit of volume and
-    return a Boolean result.
+    return a Boolean result. The set of units strings is small, so the
+    results are cached.
     """
 
     match = _regex_is_vol_unit.search(units_text)
@@ -525,31 +537,22 @@ def _convert_units(value, units, is_area_measurement, is_vol_measurement):
     the new value.
     """
 
-    convert_cm = units.startswith('cm') or    \
-                 units.startswith('centi') or \
-                 units.startswith('cc')
-    convert_in = units.startswith('in')
     is_area    = is_area_measurement or _is_area_unit(units)
     is_volume  = is_vol_measurement or _is_vol_unit(units)
 
     if _TRACE:
         log('_convert_units::is_area: {0}'.format(is_area))
         log('_convert_units::is_volume: {0}'.format(is_volume))
-    
-    if convert_cm:
-        # convert from cm to mm
-        value = value * _CM_TO_MM
-        if is_area:
-            value = value * _CM_TO_MM
-        elif is_volume:
-            value = value * _CM_TO_MM_SQ
-    elif convert_in:
-        # convert from inches to mm
-        value = value * _IN_TO_MM
+
+    # no conversion needed for mm
+    factors = _UNIT_CONVERSION_MAP.get(units[:1])
+    if factors is not None:
+        linear, area, volume = factors
+        value = value * linear
         if is_area:
-            value = value * _IN_TO_MM
+            value = value * area
         elif is_volume:
-            value = value * _IN_TO_MM_SQ
+            value = value * volume
 
     return value
 
@@ -565,8 +568,8 @@ def _tokenize_complete_list(sentence, list_text, list_start):
     # make the subsequent tokenization code simpler. Also replace any dash
     # chars with a space.
 
-    list_text = re.sub(r'and', r',  ', list_text)
-    list_text = re.sub(r'-', r' ', list_text)
+    list_text = list_text.replace('and', ',  ')
+    list_text = list_text.replace('-', ' ')
 
     units_match = _regex_list_units.search(list_text)
     if units_match:
@@ -1154,34 +1157,48 @@ def _clean_sentence(sentence):
     return sentence
 
 
+# associates a regex index with its measurement tokenizer function
+_TOKENIZER_MAP = {0:_tokenize_xyz4,
+                  1:_tokenize_xyz3,
+                  2:_tokenize_xyz2,
+                  3:_tokenize_xyz1,
+                  4:_tokenize_xy3,
+                  5:_tokenize_xy2,
+                  6:_tokenize_xy1,
+                  7:_tokenize_xx1,
+                  8:_tokenize_xx2,
+                  9:_tokenize_xvol,
+                 10:_tokenize_x,
+                 11:_tokenize_list
+}
+
+
 ###############################################################################
+@lru_cache(maxsize=8192)
 def run(sentence):
     """
 
     Search the sentence for size measurements and construct a _Measurement
     namedtuple for each measurement found. Returns a JSON string.
+
+    The JSON result is immutable, so results for repeated sentences are
+    served from an LRU cache. Call run.cache_clear() to empty it. Callers
+    that pass entire documents, which rarely repeat, should call
+    run.__wrapped__ to bypass the cache.
     
     """
 
-    # associates a regex index with its measurement tokenizer function
-    TOKENIZER_MAP = {0:_tokenize_xyz4,
-                     1:_tokenize_xyz3,
-                     2:_tokenize_xyz2,
-                     3:_tokenize_xyz1,
-                     4:_tokenize_xy3,
-                     5:_tokenize_xy2,
-                     6:_tokenize_xy1,
-                     7:_tokenize_xx1,
-                     8:_tokenize_xx2,
-                     9:_tokenize_xvol,
-                    10:_tokenize_x,
-                    11:_tokenize_list
-    }
-    
     original_sentence = sentence
     sentence = _clean_sentence(sentence)
     
     measurements = []
+
+    # no measurements are possible without a digit, so skip the regexes
+    if not _regex_digit.search(sentence):
+        return _to_json(measurements)
+
+    # find out once whether any measurement could be a 'previous' one
+    has_previous_cue = _regex_previous_cue.search(sentence) is not None
     
     # current sentence fragment, which is the entire sentence to start
     s = sentence
@@ -1199,8 +1216,8 @@ def run(sentence):
         match_start = 9999999
         match_end = 0
         
-        for i in range(len(regexes)):
-            match = regexes[i].search(s)
+        for i, regex in enumerate(regexes):
+            match = regex.search(s)
             if match:
                 match_text = match.group()
                 start = match.start()
@@ -1220,14 +1237,15 @@ def run(sentence):
         if -1 != best_regex_index:
             # attempt to match a 'previous' form
             prev_match_text = ''
-            iterator = _regex_previous.finditer(s)
-            for match_prev in iterator:
-                if not _range_overlap(match_start, match_end,
-                                      match_prev.start(), match_prev.end()):
-                    continue
-                else:
-                    prev_match_text = match_prev.group()
-                    break
+            if has_previous_cue:
+                iterator = _regex_previous.finditer(s)
+                for match_prev in iterator:
+                    if not _range_overlap(match_start, match_end,
+                                          match_prev.start(), match_prev.end()):
+                        continue
+                    else:
+                        prev_match_text = match_prev.group()
+                        break
 
             if _TRACE:
                 log(' MATCHING TEXT: ->{0}<-'.format(best_matcher.group()))
@@ -1242,8 +1260,8 @@ def run(sentence):
             more_to_go = True
 
             # extract tokens according to the matching regex
-            tokenizer_function = TOKENIZER_MAP[best_regex_index]
-            if _LIST_TOKENIZER_FUNCTION_NAME == tokenizer_function.__name__:
+            tokenizer_function = _TOKENIZER_MAP[best_regex_index]
+            if _tokenize_list is tokenizer_function:
                 tokens, list_text = _tokenize_list(best_matcher, s)
                 best_match_text = list_text
             else:
@@ -1258,7 +1276,7 @@ def run(sentence):
                                        temporality = str_temporal,
                                        subject = '',
                                        location = '',
-                                       token_list = deepcopy(tokens))
+                                       token_list = tokens)
             measurements.append(measurement)
 
             if _TRACE:
@@ -1269,7 +1287,7 @@ def run(sentence):
 
             # use unmatched portion of sentence for next iteration
             s = sentence[prev_end:]
-            if 0 == len(s):
+            if 0 == len(s) or not _regex_digit.search(s):
                 break
 
     # convert list to JSON
@@ -22,6 +22,10 @@ spacy = segmentation_init()
 log('Done initializing models for term finder...')
 regex_cache = LRUCache(maxsize=1000)
 
+# translation tables for cleaning up terms and sentences in a single pass
+newline_table = str.maketrans('\r\n', '  ')
+punctuation_table = str.maketrans('', '', string.punctuation)
+
 
 class IdentifiedTerm(BaseModel):
 
@@ -108,7 +112,7 @@ def get_full_text_matches(matchers, text: str, filters=None, section_headers=Non
         sentences = list()
         if strip_punct:
             for s in sentences:
-                sentences.append(s.lower().translate(str.maketrans('', '', string.punctuation)))
+                sentences.append(s.lower().translate(punctuation_table))
         else:
             sentences = sentences_raw
         # section_code = ".".join([str(i) for i in section_headers[idx].treecode_list])
@@ -155,7 +159,7 @@ class TermFinder(BaseModel):
 
         self.terms = list()
         for s in match_terms:
-            s = s.replace("\r", " ").replace("\n", " ").strip()
+            s = s.translate(newline_table).strip()
             self.terms.append(s.lower())
         self.terms = list(set(self.terms))
         self.matchers = []
@@ -175,9 +179,9 @@ class TermFinder(BaseModel):
         self.excluded_terms = list()
         if excluded_terms and len(excluded_terms) > 0:
             for s in excluded_terms:
-                s = s.replace("\r", " ").replace("\n", " ").trim()
+                s = s.translate(newline_table).strip()
                 self.excluded_terms.append(s.lower())
-                self.excluded_terms.append(s.lower().translate(str.maketrans('', '', string.punctuation)))
+                self.excluded_terms.append(s.lower().translate(punctuation_table))
         self.excluded_terms = list(set(self.excluded_terms))
         self.excluded_matchers = [get_matcher(t) for t in self.excluded_terms]
 
@@ -14,6 +14,7 @@ import os
 import sys
 import json
 import argparse
+from operator import attrgetter
 from collections import namedtuple
 
 if __name__ == '__main__':
@@ -166,17 +167,24 @@ def _compare_results(
 
         return False
 
+    # fast path: compare the checked fields of all results at once, in order
+    get_fields = attrgetter(*field_list)
+    computed_keys = [get_fields(t) for t in computed_values]
+    expected_keys = [get_fields(e) for e in expected_values]
+    if computed_keys == expected_keys:
+        return True
+
     # check fields for each result
     failures = []
-    for i, t in enumerate(computed_values):
+    for t, e in zip(computed_values, expected_values):
+        expected = e._asdict()
         # iterate over fields of current result
         for field, value in t._asdict().items():
-            expected = expected_values[i]._asdict()
             # compare only those fields in _RESULT_FIELDS
             if field in field_list:
                 if value != expected[field]:
                     # append as namedtuples
-                    failures.append( (t, expected_values[i]) )
+                    failures.append( (t, e) )
 
     if len(failures) > 0:
         print(sentence)
@@ -853,6 +861,9 @@ def test_date_finder():
 ###############################################################################
 def test_size_measurement_finder():
 
+    # start with an empty cache so that every test sentence is processed
+    smf.run.cache_clear()
+
     # str_x_cm (x)
     test_data = {
         'The result is 1.5 cm in my estimation.':[
@@ -1379,6 +1390,9 @@ def test_size_measurement_finder():
 ###############################################################################
 def test_o2sat_finder():
 
+    # start with an empty cache so that every test sentence is processed
+    o2f.run.cache_clear()
+
     test_data = {
         'Vitals were HR=120, BP=109/44, RR=29, POx=93% on 8L FM':[
             _O2Result(text='POx=93% on 8L FM',
@@ -2066,7 +2080,25 @@ def test_o2sat_finder():
                       flow_rate = 2.0,
                       device = 'nasal canula',
                       condition = o2f.STR_O2_EQUAL)
-        ]
+        ],
+        # connector with more symbol/word alternations than _CONNECTOR_DEPTH
+        'SpO2' + ' - is'*9 + ' - 95% on 2L NC':[
+            _O2Result(text = 'SpO2' + ' - is'*9 + ' - 95% on 2L NC',
+                      pao2_est = 79,
+                      fio2_est = 28,
+                      p_to_f_ratio_est = 282,
+                      flow_rate = 2.0,
+                      device = 'NC',
+                      condition = o2f.STR_O2_EQUAL,
+                      value = 95)
+        ],
+        # long multi-line note text with no value; used to cause
+        # catastrophic backtracking in the 'cond' connector
+        'RESP: Intubated and sedated.\n'                                        \
+        '    Follow P/F ratio when possible. Wean vent settings as tolerated\n' \
+        '    and keep head of bed elevated.\n\n'                                \
+        '    Will discuss goals of care with family in the morning and\n'       \
+        '    update the primary team after rounds.':[]
     }
 
     if not _run_tests(_MODULE_O2, test_data):
@@ -2078,6 +2110,9 @@ def test_o2sat_finder():
 ###############################################################################
 def test_covid_finder():
 
+    # start with an empty cache so that every test sentence is processed
+    cf.run.cache_clear()
+
     test_data = {
         '16 New Cases COVID-19 Claims Three More Lives in Atlantic County':[
             _CovidResult(text_case = '16 new cases', value_case = 16)
@@ -125,9 +125,7 @@ def tnum_to_int(str_tnum, debug=False):
         print('\tstr_tnum: "{0}"'.format(str_tnum))
 
     # replace dashes with a space and collapse any repeated spaces
-    text = re.sub(r'\-', ' ', str_tnum)
-    text = re.sub(r'\s+', ' ', text)
-    text = text.strip()
+    text = ' '.join(str_tnum.replace('-', ' ').split())
 
     if debug:
         print('\ttnum after dash replacement: "{0}"'.format(text))
@@ -4,7 +4,6 @@ Concept graph derived from the SecTag hierarchy.
 """
 
 import os
-from copy import deepcopy
 from claritynlp_logging import log, ERROR, DEBUG
 
 
@@ -42,10 +41,10 @@ class Node():
         self.child_indices.add(child_index)
 
     def get_parents(self):
-        return deepcopy(self.parent_indices);
+        return set(self.parent_indices);
 
     def get_children(self):
-        return deepcopy(self.child_indices);
+        return set(self.child_indices);
 
     def dump(self):
         log("cid: {0}, level: {1}, name: {2}".format(self.cid, self.level, self.concept_name))
@@ -190,7 +189,7 @@ class ConceptGraph():
             raise NodeNotFoundException(cid)
 
         node_index = self.cid_to_index_map[cid]
-        return deepcopy(self.nodes[node_index].treecode_list)
+        return list(self.nodes[node_index].treecode_list)
 
     def all_ancestors_of_node(self, node_index):
         """Return the set of all ancestor node indices for the given node."""
@@ -16,11 +16,26 @@ from section_tagger import section_tagger_init
 from section_tagger import process_report
 
 # XML character entity
-regex_xml_character_entity = re.compile(r'&(?:#([0-9]+)|#x([0-9a-fA-F]+)|([0-9a-zA-Z]+));');
+str_xml_character_entity = r'&(?:#[0-9]+|#x[0-9a-fA-F]+|[0-9a-zA-Z]+);'
+
+# One or more newlines, or a run of spaces and XML character entities. Each
+# entity becomes a space and repeated spaces collapse into one, so a run of
+# spaces and entities is replaced by a single space. This cleans a report in
+# one pass instead of three.
+regex_report_cleanup = re.compile(r'\n+|(?: |' + str_xml_character_entity + r')+')
+
+
+###############################################################################
+def cleanup_replacement(match):
+    """
+    Return the replacement text for a regex_report_cleanup match.
+    """
+
+    if match.group().startswith('\n'):
+        return '\n'
+    else:
+        return ' '
 
-# one or more spaces and newlines
-regex_multi_space   = re.compile(r' +')
-regex_multi_newline = re.compile(r'\n+')
 
 ###############################################################################
 def show_help():
@@ -70,14 +85,13 @@ if __name__ == '__main__':
             ok = False
             break
 
-        # remove explicit XML entities
-        no_xml_entities = regex_xml_character_entity.sub(' ', report)
-
-        # collapse repeated newlines into a single newline
-        single_newline_report = regex_multi_newline.sub('\n', no_xml_entities)
-
-        # collapse repeated spaces into a single space
-        clean_report = regex_multi_space.sub(' ', single_newline_report)
+        # remove explicit XML entities, collapse repeated newlines into a
+        # single newline, and collapse repeated spaces into a single space;
+        # skip the regex scan if the report has nothing for it to change
+        if '&' in report or '\n\n' in report or '  ' in report:
+            clean_report = regex_report_cleanup.sub(cleanup_replacement, report)
+        else:
+            clean_report = report
 
         section_headers, section_texts = process_report(clean_report)
         for i in range(len(section_headers)):
@@ -2,7 +2,6 @@
 
 import re
 import os
-from copy import deepcopy
 
 from nltk.tokenize import sent_tokenize
 from claritynlp_logging import log, ERROR, DEBUG
@@ -558,7 +557,7 @@ def resolve_ambiguities(candidate_headers, stack):
             log("\t\tLongest code at index: {0}".format(indices_of_longest), DEBUG)
             log("\t\tall_same_length: {0}".format(all_same_length), DEBUG)
             
-        best_candidates_map[stack_index] = (longest, deepcopy(indices_of_longest), all_same_length)
+        best_candidates_map[stack_index] = (longest, list(indices_of_longest), all_same_length)
 
         # go up to the next level in the stack and try again, may find a nearer common ancestor
         stack_index -= 1
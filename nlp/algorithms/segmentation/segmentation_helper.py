@@ -339,7 +339,8 @@ def _find_size_meas_subs(report, sub_list, token_text):
     measurements after the first '.'.
     """
 
-    json_string = smf.run(report)
+    # bypass the sentence cache; whole reports almost never repeat
+    json_string = smf.run.__wrapped__(report)
     if '[]' == json_string:
         return report
     
@@ -55,7 +55,7 @@ def run_measurement_finder_full(text, term_list, is_case_sensitive_text=False):
                     
                 except Exception as ex:
                     log('measurement_finder_wrapper exception: {0}'.format(ex), ERROR)
-                    log(ERROR, ex)
+                    log(ex, ERROR)
 
     return results
 
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from flask import request, Blueprint
 from luigi_tools import phenotype_helper, luigi_runner
 from data_access import *
@@ -86,6 +87,9 @@ def post_nlpql(raw_nlpql:str, source_id: str, background: bool):
         return phenotype_info
 
 
+# the parse result depends only on the NLPQL text, so clients that validate
+# the same library repeatedly get the cached JSON string
+@lru_cache(maxsize=256)
 def parse_nlpql(nlpql: str):
     nlpql_results = run_nlpql_parser(nlpql)
     if nlpql_results['has_errors'] or nlpql_results['has_warnings']:
@@ -1,6 +1,5 @@
 import logging
 from time import localtime, strftime
-import inspect
 from os import environ
 import sys
 import traceback
@@ -13,27 +12,36 @@ WARNING = "WARNING"
 ERROR = "ERROR"
 CRITICAL = "CRITICAL"
 
+_LEVELS = {DEBUG, INFO, WARNING, ERROR, CRITICAL}
 
-def log(obj='', level=INFO, file=sys.stdout):
-    the_stack = inspect.stack()[1]
-    the_caller = the_stack[0].f_locals.get('self', None)
 
+def log(obj='', *args, level=INFO, file=sys.stdout):
+    """
+    Log 'obj' at the given level. Messages are always rendered with repr(),
+    as they were before printf-style arguments were supported: log(obj) logs
+    repr(obj) and log(fmt, *args) logs repr(fmt % args). If 'obj' is not a
+    format string for 'args', the repr() of 'obj' and of each argument are
+    joined with spaces instead.
+    """
+
+    # legacy call style: log(obj, level)
+    if len(args) == 1 and isinstance(args[0], str) and args[0] in _LEVELS:
+        level = args[0]
+        args = ()
+
+    # exceptions are always logged at ERROR level, regardless of 'level';
+    # anything that is not a known level is logged at INFO
     if isinstance(obj, Exception):
-        log("EXCEPTION: {}".format(repr(obj), level=ERROR))
-        for t in traceback.format_tb(obj.__traceback__):
-            lines = t.split('\n')
-            for l in lines:
-                if l.strip() == '':
-                    continue
-                log("     {}".format(l), level=ERROR)
-        return
+        level = ERROR
+    elif not isinstance(level, str) or level not in _LEVELS:
+        level = INFO
 
-    repr_obj = repr(obj)
-    if '\n' in repr_obj:
-        for l in repr_obj.split('\n'):
-            log(l, level=level)
+    # skip all formatting work if the app logger would discard the message
+    if the_app and not the_app.logger.isEnabledFor(logging.getLevelName(level)):
         return
 
+    # sys._getframe is much cheaper than inspect.stack(), which reads source files
+    the_caller = sys._getframe(1).f_locals.get('self', None)
     if the_caller:
         the_caller = "({}) ".format(repr(the_caller.__class__.__name__))
     else:
@@ -43,8 +51,36 @@ def log(obj='', level=INFO, file=sys.stdout):
         if file == sys.stdout:
             file = sys.stderr
 
+    if isinstance(obj, Exception):
+        _emit("EXCEPTION: {}".format(repr(obj)), the_caller, level, file)
+        for t in traceback.format_tb(obj.__traceback__):
+            lines = t.split('\n')
+            for l in lines:
+                if l.strip() == '':
+                    continue
+                _emit("     {}".format(l), the_caller, level, file)
+        return
+
+    if args:
+        # printf-style arguments are only formatted once the level has passed;
+        # a logging call must never raise, so fall back to the separate reprs
+        repr_obj = None
+        if isinstance(obj, str):
+            try:
+                repr_obj = repr(obj % args)
+            except (TypeError, ValueError, KeyError):
+                pass
+        if repr_obj is None:
+            repr_obj = ' '.join(repr(a) for a in (obj,) + args)
+    else:
+        repr_obj = repr(obj)
+    for l in repr_obj.split('\n'):
+        _emit(l, the_caller, level, file)
+
+
+def _emit(message, the_caller, level, file):
     if the_app:
-        message = "{}{}".format(the_caller, repr_obj)
+        message = "{}{}".format(the_caller, message)
         if level == DEBUG:
             the_app.logger.debug(message)
         elif level == WARNING:
@@ -56,7 +92,6 @@ def log(obj='', level=INFO, file=sys.stdout):
         else:
             the_app.logger.info(message)
     else:
-        message = repr_obj
         the_time = strftime("%Y-%m-%d %H:%M:%S-%Z", localtime())
         print("[{}] {} in claritynlp_logging: {}{}".format(the_time, level, the_caller, message), file=file)
 
@@ -15,18 +15,39 @@ class AzureSentimentTask(BaseTask):
     # });
 
     def run_custom_task(self, temp_file, mongo_client: MongoClient):
-        for doc in self.docs:
+        headers = {'Content-Type': 'application/json', 'Ocp-Apim-Subscription-Key': self.pipeline_config.custom_arguments['api_key']}
 
-            headers = {'Content-Type': 'application/json', 'Ocp-Apim-Subscription-Key': self.pipeline_config.custom_arguments['api_key']}
+        # reuse one HTTP connection pool for all requests made by this task
+        with requests.Session() as session:
+            for doc in self.docs:
 
-            sentence_list = self.get_document_sentences(doc)
+                sentence_list = self.get_document_sentences(doc)
 
-            if self.pipeline_config.terms:
-                for sentence in sentence_list:
-                    if any(word.lower() in sentence.lower() for word in self.pipeline_config.terms):
+                if self.pipeline_config.terms:
+                    for sentence in sentence_list:
+                        if any(word.lower() in sentence.lower() for word in self.pipeline_config.terms):
+                            payload = {"documents": [{"language": "en", "id": "1", "text": sentence}]}
+                            self.write_log_data("RUNNING", "Processing Azure with Termset")
+                            response = session.post('https://eastus.api.cognitive.microsoft.com/text/analytics/v2.0/sentiment', headers=headers, json=payload)
+                            if response.status_code == 200:
+                                json_response = response.json()
+                                val = json_response['documents'][0]
+                                obj = {
+                                    'sentiment_score': val['score'],
+                                    'sentence': sentence
+                                }
+
+                                # writing results
+                                self.write_result_data(temp_file, mongo_client, doc, obj)
+
+                            else:
+                                # writing to log (optional)
+                                self.write_log_data("OOPS", "No sentiment this time!")
+                else:
+                    for sentence in sentence_list:
                         payload = {"documents": [{"language": "en", "id": "1", "text": sentence}]}
-                        self.write_log_data("RUNNING", "Processing Azure with Termset")
-                        response = requests.post('https://eastus.api.cognitive.microsoft.com/text/analytics/v2.0/sentiment', headers=headers, json=payload)
+                        self.write_log_data("RUNNING", "Processing Azure without Termset")
+                        response = session.post('https://eastus.api.cognitive.microsoft.com/text/analytics/v2.0/sentiment', headers=headers, json=payload)
                         if response.status_code == 200:
                             json_response = response.json()
                             val = json_response['documents'][0]
@@ -41,22 +62,3 @@ class AzureSentimentTask(BaseTask):
                         else:
                             # writing to log (optional)
                             self.write_log_data("OOPS", "No sentiment this time!")
-            else:
-                for sentence in sentence_list:
-                    payload = {"documents": [{"language": "en", "id": "1", "text": sentence}]}
-                    self.write_log_data("RUNNING", "Processing Azure without Termset")
-                    response = requests.post('https://eastus.api.cognitive.microsoft.com/text/analytics/v2.0/sentiment', headers=headers, json=payload)
-                    if response.status_code == 200:
-                        json_response = response.json()
-                        val = json_response['documents'][0]
-                        obj = {
-                            'sentiment_score': val['score'],
-                            'sentence': sentence
-                        }
-
-                        # writing results
-                        self.write_result_data(temp_file, mongo_client, doc, obj)
-
-                    else:
-                        # writing to log (optional)
-                        self.write_log_data("OOPS", "No sentiment this time!")
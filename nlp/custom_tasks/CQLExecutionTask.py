@@ -202,11 +202,11 @@ def _to_result_obj(obj):
     to MongoDB.
     """
 
-    # if _TRACE:
-    log('Calling _to_result_obj...')
-    log('obj: ')
-    log(obj)
-    log()
+    # the full result object is large, so dump it at DEBUG level only
+    log('Calling _to_result_obj...', DEBUG)
+    log('obj: ', DEBUG)
+    log(obj, DEBUG)
+    log('', DEBUG)
 
     codesys_map = {
         'http://snomed.info/ct':'SNOMED',
@@ -687,22 +687,27 @@ class CQLExecutionTask(BaseTask):
 
         results = None
         if 200 == r.status_code:
+            # decode the response body only once
+            json_results = r.json()
             if _TRACE:
-                log('\n*** CQL JSON RESULTS ***\n')
-                log(r.json())
-                log()
+                log('\n*** CQL JSON RESULTS ***\n', DEBUG)
+                log(json_results, DEBUG)
+                log('', DEBUG)
 
             # data_earliest == earliest datetime in the data
             # data_latest   == latest datetime in the data
-            results, data_earliest, data_latest = _json_to_objs(r.json())
-            log('\tCQLExecutionTask: found {0} results'.format(len(results)))
+            results, data_earliest, data_latest = _json_to_objs(json_results)
         else:
             log('\n*** CQLExecutionTask: HTTP status code {0} ***\n'.format(r.status_code))
             return
 
+        # nothing to filter or write if the CQL Engine returned no results
         if results is None or (0 == len(results)):
+            log('\tCQLExecutionTask: found 0 results')
             return
 
+        log('\tCQLExecutionTask: found {0} results'.format(len(results)))
+
         # parse datetime_start, datetime_end time commands, if any, and
         # filter data to specified time window
         datetime_start, datetime_end = _get_datetime_window(
@@ -715,6 +720,8 @@ class CQLExecutionTask(BaseTask):
         results = _apply_datetime_filter(results, datetime_start, datetime_end)
         log('\n*** CQLExecutionTask: {0} results after time filtering. ***'.
               format(len(results)))
+        if 0 == len(results):
+            return
 
         # get the value filter custom arg, if any
         str_value_filter = _get_custom_arg(_ARG_VALUE_FILTER,
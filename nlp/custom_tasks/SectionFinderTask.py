@@ -53,6 +53,9 @@ class SectionFinderTask(BaseTask):
         section_string = self.pipeline_config.custom_arguments['section_list']
         items = section_string.split(',')
         section_list = [item.strip().lower() for item in items]
+
+        # one regex scan finds headers containing any of the desired sections
+        section_regex = re.compile('|'.join(re.escape(s) for s in section_list))
         
         #for s in section_list:
         #    log('next section from list: "{0}"'.format(s))
@@ -62,22 +65,21 @@ class SectionFinderTask(BaseTask):
 
             # get all sections in this document
             section_headers, section_texts = self.get_document_sections_ext(doc)
-            section_headers = [h.lower() for h in section_headers]
-
-            for q in range(len(section_headers)):
-                # next section header with bracketed concept number
-                next_header = section_headers[q]
-                # text of this section
-                next_text = section_texts[q]
-                
-                for s in section_list:
-                    if s in next_header:
-                        
-                        #log('*** DOC {0} CONTAINS SECTION "{1}: {2}" ***'.format(i, next_header, next_text[:64]))
-
-                        obj = {
-                            'section_header' : next_header,
-                            'section_text'   : next_text
-                        }
-
-                        self.write_result_data(temp_file, mongo_client, doc, obj)
+
+            # next section header with bracketed concept number, and its text
+            for next_header, next_text in zip(section_headers, section_texts):
+                next_header = next_header.lower()
+
+                # write each matching section once, even if its header
+                # contains more than one of the desired sections
+                if not section_regex.search(next_header):
+                    continue
+
+                #log('*** DOC {0} CONTAINS SECTION "{1}: {2}" ***'.format(i, next_header, next_text[:64]))
+
+                obj = {
+                    'section_header' : next_header,
+                    'section_text'   : next_text
+                }
+
+                self.write_result_data(temp_file, mongo_client, doc, obj)
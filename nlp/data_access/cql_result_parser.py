@@ -52,6 +52,9 @@ _regex_datetime = re.compile(_str_datetime)
 
 _regex_coding = re.compile(r'\Acode_coding_(?P<num>\d)_')
 
+# list index that follows a flattened key prefix, such as the 3 in 'name_3_given'
+_regex_list_index = re.compile(r'(?P<num>\d+)')
+
 _KEY_END         = 'end'
 _KEY_START       = 'start'
 _KEY_SUBJECT     = 'subject'
@@ -167,11 +170,14 @@ def _set_list_length(obj, prefix_str):
     contains this length.
     """
 
-    str_search = r'\A' + prefix_str + r'_(?P<num>\d+)_?'
+    prefix = prefix_str + '_'
+    prefix_len = len(prefix)
 
     max_num = None
-    for k,v in obj.items():
-        match = re.match(str_search, k)
+    for k in obj:
+        if not k.startswith(prefix):
+            continue
+        match = _regex_list_index.match(k, prefix_len)
         if match:
             num = int(match.group('num'))
             if max_num is None:
@@ -259,14 +259,14 @@ def phenotype_structure(phenotype_id: int, connection_string: str):
         config = json.loads(cursor.fetchone()[0])
 
         if 'operations' in config:
-            final_ops = list(filter(lambda o: o['final'], config['operations']))
+            final_ops = [o for o in config['operations'] if o['final']]
             ops = {o['name']: o for o in config['operations']}
         else:
             final_ops = list()
             ops = dict()
 
         if 'data_entities' in config:
-            final_des = list(filter(lambda o: o['final'], config['data_entities']))
+            final_des = [o for o in config['data_entities'] if o['final']]
             des = {o['name']: o for o in config['data_entities']}
         else:
             des = dict()
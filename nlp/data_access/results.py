@@ -162,7 +162,6 @@ def phenotype_feedback_results(job: str):
             columns = sorted(['comments', 'feature', 'is_correct', 'job_id', 'subject', 'report_id', 'result_id'])
 
             for res in query_results:
-                keys = list(res.keys())
                 if not header_written:
                     length = len(columns)
                     csv_writer.writerow(columns)
@@ -171,7 +170,7 @@ def phenotype_feedback_results(job: str):
                 output = [''] * length
                 i = 0
                 for key in columns:
-                    if key in keys:
+                    if key in res:
                         val = res[key]
                         output[i] = val
                     else:
@@ -203,10 +202,9 @@ def pipeline_results(job: str):
             header_values = pipeline_output_positions
             length = 0
             for res in db.pipeline_results.find({"job_id": int(job)}):
-                keys = list(res.keys())
                 if not header_written:
                     new_cols = []
-                    for k in keys:
+                    for k in res:
                         if k not in header_values:
                             new_cols.append(k)
                     new_cols = sorted(new_cols)
@@ -219,7 +217,7 @@ def pipeline_results(job: str):
                 i = 0
                 output = [''] * length
                 for key in header_values:
-                    if key in keys:
+                    if key in res:
                         val = res[key]
                         output[i] = val
                     i += 1
@@ -276,7 +274,6 @@ def generic_results(job: str, job_type: str, phenotype_final: bool = False):
             query_results = db[job_type + "_results"].find(query)
             columns = sorted(get_columns(db, job, job_type, phenotype_final))
             for res in query_results:
-                keys = list(res.keys())
                 if not header_written:
                     length = len(columns)
                     csv_writer.writerow(columns)
@@ -285,7 +282,7 @@ def generic_results(job: str, job_type: str, phenotype_final: bool = False):
                 output = [''] * length
                 i = 0
                 for key in columns:
-                    if key in keys:
+                    if key in res:
                         val = res[key]
                         output[i] = val
                     else:
@@ -329,7 +326,7 @@ def lookup_phenotype_results_by_id(id_list: list):
         # db.phenotype_results.find({"_id": { $in: [ObjectId("5b117352bcf26f020e392a9c"),
         # ObjectId("5b117352bcf26f020e3926e2")]}})
         # TODO TODO TODO
-        ids = list(map(lambda x: ObjectId(x), id_list))
+        ids = [ObjectId(x) for x in id_list]
         res = db.phenotype_results.find({
             "_id": {
                 "$in": ids
@@ -3,6 +3,7 @@ from urllib import request
 from urllib.parse import quote
 import simplejson
 import requests
+import threading
 import util
 from ohdsi import getCohort
 import traceback
@@ -144,6 +145,19 @@ def get_headers():
     return HEADERS
 
 
+# one requests.Session per thread, so that repeated Solr queries from the
+# luigi worker threads reuse keep-alive connections
+_thread_local = threading.local()
+
+
+def get_session():
+    session = getattr(_thread_local, 'session', None)
+    if session is None:
+        session = requests.Session()
+        _thread_local.session = session
+    return session
+
+
 def make_post_body(qry, fq, sort, start, rows):
     data = dict()
     data['query'] = qry
@@ -188,7 +202,7 @@ def query(qry, mapper_url='', mapper_inst='', mapper_key='', tags: list=None,
     #log('solr_data.query: {0}'.format(post_data))
 
     # Getting ID for new cohort
-    response = requests.post(url, headers=get_headers(), data=post_data)
+    response = get_session().post(url, headers=get_headers(), data=post_data)
 
     # log(response['response']['numFound'], "documents found.")
 
@@ -234,7 +248,7 @@ def query_doc_size(qry, mapper_url, mapper_inst, mapper_key, tags: list=None,
         log(post_data, DEBUG)
 
     # Getting ID for new cohort
-    response = requests.post(url, headers=get_headers(), data=post_data)
+    response = get_session().post(url, headers=get_headers(), data=post_data)
     if response.status_code != 200:
         return 0
 
@@ -253,7 +267,7 @@ def query_doc_by_id(report_id, solr_url='http://nlp-solr:8983/solr/sample'):
     #     log("Querying to get document " + url, DEBUG)
     #     log(post_data, DEBUG)
 
-    response = requests.post(url, headers=get_headers(), data=post_data)
+    response = get_session().post(url, headers=get_headers(), data=post_data)
     if response.status_code != 200:
         return {}
 
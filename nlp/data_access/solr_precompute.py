@@ -60,7 +60,7 @@ def retry(docs):
     if response2.status_code == 200:
         log('successful retry!!!')
     else:
-        log('failed retry: ', response2.reason)
+        log('failed retry: %s', response2.reason)
         log(response2.content)
 
 
@@ -94,7 +94,7 @@ def pre_compute(n):
                 ids.append(doc[util.solr_report_id_field])
                 updated_docs.append(doc)
 
-        log('updating the following docs: ', ids)
+        log('updating the following docs: %s', ids)
         if n % 10 == 0:
             log("******************************")
             done_doc_size = query_doc_size("sentence_attrs:*", solr_url=solr_url, mapper_inst=util.report_mapper_inst,
@@ -109,7 +109,7 @@ def pre_compute(n):
         if response2.status_code == 200:
             log('success!!!')
         else:
-            log('fail: ', response2.reason)
+            log('fail: %s', response2.reason)
             log(response2.content)
             retry(updated_docs)
     except Exception as ex:
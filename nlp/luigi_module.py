@@ -14,6 +14,7 @@ from luigi_tools import phenotype_helper
 from tasks import *
 from claritynlp_logging import log, ERROR, DEBUG
 
+import os
 import util
 import threading
 import multiprocessing
@@ -21,8 +22,14 @@ from time import sleep
 from queue import Queue, Empty
 
 
-# get the number of CPU cores and use it to constrain the number of worker threads
-_cpu_count = multiprocessing.cpu_count()
+# get the number of CPU cores this process may run on and use it to constrain
+# the number of worker threads; in a container with a cpuset this is smaller
+# than the host CPU count reported by multiprocessing.cpu_count()
+try:
+    _cpu_count = len(os.sched_getaffinity(0))
+except AttributeError:
+    # sched_getaffinity is not available on all platforms
+    _cpu_count = multiprocessing.cpu_count()
 
 # user-specified number of workers
 _luigi_workers = int(util.luigi_workers)
@@ -226,7 +226,7 @@ def pipeline_mongo_writer(client, pipeline_id, pipeline_type, job, batch, p_conf
             data_fields['result_display']['highlights'] = highlights
 
     inserted = config.insert_pipeline_results(p_config, db, data_fields)
-    log('(job={}; pipeline={}) inserted into mongodb {}'.format(job, pipeline_id, repr(inserted.inserted_id)), DEBUG)
+    log('(job=%s; pipeline=%s) inserted into mongodb %r', job, pipeline_id, inserted.inserted_id, level=DEBUG)
 
     return inserted
 